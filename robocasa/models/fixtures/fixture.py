@@ -18,7 +18,10 @@ from robosuite.utils.mjcf_utils import (
 import robocasa
 import robocasa.macros as macros
 from robocasa.models.objects import MujocoXMLObject
-from robocasa.utils.object_utils import get_pos_after_rel_offset
+from robocasa.utils.object_utils import (
+    get_pos_after_rel_offset,
+    invalidate_obj_geometry,
+)
 
 
 def site_pos(site):
@@ -207,6 +210,14 @@ class Fixture(MujocoXMLObject):
         scale[2] = scale[2] or scale[0] or scale[1]
         self.set_scale(scale)
 
+    def set_scale(self, scale, obj=None):
+        """
+        Scales the fixture, see MujocoXMLObject.set_scale. Also drops any cached
+        geometry of the fixture, which no longer matches its sites.
+        """
+        super().set_scale(scale, obj=obj)
+        invalidate_obj_geometry(self)
+
     def get_reset_regions(self, *args, **kwargs):
         """
         returns dictionary of reset regions, each region defined as position, x_bounds, y_bounds
@@ -334,6 +345,7 @@ class Fixture(MujocoXMLObject):
         """
         for (name, pos) in pos_dict.items():
             self._bounds_sites[name].set("pos", array_to_string(pos))
+        invalidate_obj_geometry(self)
 
     def get_ext_sites(self, all_points=False, relative=True):
         """
@@ -157,6 +157,17 @@ class MJCFObject(MujocoXMLObject):
 
         return geom_pairs
 
+    def set_scale(self, scale, obj=None):
+        """
+        Scales the object, see MujocoXMLObject.set_scale. Also drops any cached
+        geometry of the object, which no longer matches its sites.
+        """
+        # imported here since object_utils imports this module
+        from robocasa.utils.object_utils import invalidate_obj_geometry
+
+        super().set_scale(scale, obj=obj)
+        invalidate_obj_geometry(self)
+
     def get_joint(self, joint_name: str):
         _, _, joints = self._get_elements_by_name(
             geom_names=[], body_names=[], joint_names=[joint_name]
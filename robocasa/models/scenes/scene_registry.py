@@ -1,5 +1,5 @@
-from collections import OrderedDict
 from enum import IntEnum
+from functools import lru_cache
 from robosuite.utils.mjcf_utils import xml_path_completion
 import robocasa
 
@@ -21,8 +21,9 @@ class TabletopLayoutType(IntEnum):
 
 
 TABLETOP_LAYOUT_GROUPS_TO_IDS = {
-    -1: list(range(len(TabletopLayoutType) - 1)),  # all
+    -1: tuple(range(len(TabletopLayoutType) - 1)),  # all
 }
+_ALL_TABLETOP_LAYOUTS = TABLETOP_LAYOUT_GROUPS_TO_IDS[TabletopLayoutType.ALL]
 
 
 class StyleType(IntEnum):
@@ -48,8 +49,26 @@ class StyleType(IntEnum):
 
 
 STYLE_GROUPS_TO_IDS = {
-    -1: list(range(12)),  # all
+    -1: tuple(range(12)),  # all
 }
+_ALL_STYLES = STYLE_GROUPS_TO_IDS[StyleType.ALL]
+
+
+def _layout_file_name(layout):
+    name = layout.name.lower()
+    # special case: if name starts with one letter, capitalize it
+    if len(name) > 1 and name[1] == "_":
+        name = name.capitalize()
+    return name
+
+
+# lookup tables from enum value to yaml file name, built once at import.
+# ids are contiguous from 0, so a list indexed by id suffices. groups (negative
+# values) are excluded and must be expanded via unpack_*_ids instead.
+_TABLETOP_LAYOUT_NAMES = [
+    _layout_file_name(m) for m in sorted(TabletopLayoutType, key=int) if int(m) >= 0
+]
+_STYLE_NAMES = [m.name.lower() for m in sorted(StyleType, key=int) if int(m) >= 0]
 
 
 def get_tabletop_layout_path(layout_id):
@@ -62,20 +81,19 @@ def get_tabletop_layout_path(layout_id):
     Return:
         str: yaml path for specified layout
     """
-    if isinstance(layout_id, int):
-        layout_int_to_name = dict(
-            map(lambda item: (item.value, item.name.lower()), TabletopLayoutType)
-        )
-        layout_name = layout_int_to_name[layout_id]
-    elif isinstance(layout_id, TabletopLayoutType):
-        layout_name = layout_id.name.lower()
-    else:
-        raise ValueError
-
-    # special case: if name starts with one letter, capitalize it
-    if layout_name[1] == "_":
-        layout_name = layout_name.capitalize()
-
+    # IntEnum members are ints, so a single coercion covers both input types
+    try:
+        layout_id = int(layout_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid layout id: {}".format(layout_id))
+    if layout_id < 0:
+        raise ValueError("Layout groups must be unpacked first: {}".format(layout_id))
+    return _resolve_tabletop_layout_path(layout_id)
+
+
+@lru_cache(maxsize=None)
+def _resolve_tabletop_layout_path(layout_id):
+    layout_name = _TABLETOP_LAYOUT_NAMES[layout_id]
     return xml_path_completion(
         f"scenes/tabletop_layouts/{layout_name}.yaml",
         root=robocasa.models.assets_root,
@@ -92,15 +110,19 @@ def get_style_path(style_id):
     Return:
         str: yaml path for specified style
     """
-    if isinstance(style_id, int):
-        style_int_to_name = dict(
-            map(lambda item: (item.value, item.name.lower()), StyleType)
-        )
-        style_name = style_int_to_name[style_id]
-    elif isinstance(style_id, StyleType):
-        style_name = style_id.name.lower()
-    else:
-        raise ValueError
+    # IntEnum members are ints, so a single coercion covers both input types
+    try:
+        style_id = int(style_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid style id: {}".format(style_id))
+    if style_id < 0:
+        raise ValueError("Style groups must be unpacked first: {}".format(style_id))
+    return _resolve_style_path(style_id)
+
+
+@lru_cache(maxsize=None)
+def _resolve_style_path(style_id):
+    style_name = _STYLE_NAMES[style_id]
 
     return xml_path_completion(
         f"scenes/kitchen_styles/{style_name}.yaml",
@@ -109,36 +131,44 @@ def get_style_path(style_id):
 
 
 def unpack_tabletop_layout_ids(layout_ids):
+    # fast path for the common request of all ids
     if layout_ids is None:
-        layout_ids = TabletopLayoutType.ALL
+        return list(_ALL_TABLETOP_LAYOUTS)
 
     if not isinstance(layout_ids, list):
+        if int(layout_ids) == TabletopLayoutType.ALL:
+            return list(_ALL_TABLETOP_LAYOUTS)
         layout_ids = [layout_ids]
 
-    layout_ids = [int(id) for id in layout_ids]
-
-    all_layout_ids = []
+    # expand groups and drop duplicates (keeping order) in a single pass
+    all_layout_ids = {}
     for id in layout_ids:
+        id = int(id)
         if id < 0:
-            all_layout_ids += TABLETOP_LAYOUT_GROUPS_TO_IDS[id]
+            for group_id in TABLETOP_LAYOUT_GROUPS_TO_IDS[id]:
+                all_layout_ids[group_id] = None
         else:
-            all_layout_ids.append(id)
-    return list(OrderedDict.fromkeys(all_layout_ids))
+            all_layout_ids[id] = None
+    return list(all_layout_ids)
 
 
 def unpack_style_ids(style_ids):
+    # fast path for the common request of all ids
     if style_ids is None:
-        style_ids = StyleType.ALL
+        return list(_ALL_STYLES)
 
     if not isinstance(style_ids, list):
+        if int(style_ids) == StyleType.ALL:
+            return list(_ALL_STYLES)
         style_ids = [style_ids]
 
-    style_ids = [int(id) for id in style_ids]
-
-    all_style_ids = []
+    # expand groups and drop duplicates (keeping order) in a single pass
+    all_style_ids = {}
     for id in style_ids:
+        id = int(id)
         if id < 0:
-            all_style_ids += STYLE_GROUPS_TO_IDS[id]
+            for group_id in STYLE_GROUPS_TO_IDS[id]:
+                all_style_ids[group_id] = None
         else:
-            all_style_ids.append(id)
-    return list(OrderedDict.fromkeys(all_style_ids))
+            all_style_ids[id] = None
+    return list(all_style_ids)
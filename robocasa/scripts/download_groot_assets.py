@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 import urllib.request
 
+from download_kitchen_assets import AssetSource
 from download_kitchen_assets import download_kitchen_assets as download
 
 DEFAULT_ASSETS_VERSION = "1b018839a6da865dffecd3185fe054211bc71270"
@@ -46,7 +47,7 @@ def get_available_registries(revision: str) -> set[Registry]:
 
 def get_groot_asset_registry(
     download_config: DownloadConfig, version: Optional[str]
-) -> dict:
+) -> tuple:
     logging.info(
         f"Initiating download for the specified assets: {', '.join(r.value for r in download_config.registries)}..."
     )
@@ -60,22 +61,27 @@ def get_groot_asset_registry(
         )
 
     available_registries = get_available_registries(version)
-    registry = {}
+    registry = []
     for r in download_config.registries:
         if r not in available_registries:
             logging.warning(
                 f"Requested registry '{r.value}' is not available at revision '{version}', skipping..."
             )
             continue
-        registry[r.value] = dict(
-            message=f"Downloading {r.value} assets",
-            url=f"{SOURCE_URL}/resolve/{version}/{r.value}.zip",
-            folder=os.path.join(
-                os.path.dirname(__file__), f"../models/assets/objects/{r.value}"
-            ),
-            check_folder_exists=False,
+        registry.append(
+            AssetSource(
+                name=r.value,
+                message=f"Downloading {r.value} assets",
+                url=f"{SOURCE_URL}/resolve/{version}/{r.value}.zip",
+                folder=os.path.normpath(
+                    os.path.join(
+                        os.path.dirname(__file__),
+                        f"../models/assets/objects/{r.value}",
+                    )
+                ),
+            )
         )
-    return registry
+    return tuple(registry)
 
 
 def download_groot_assets(
@@ -90,7 +96,7 @@ def download_groot_assets(
         download_config=download_config, version=version
     )
     if update_registry:
-        download_kitchen_assets.DOWNLOAD_ASSET_REGISTRY.update(groot_asset_registry)
+        download_kitchen_assets.DOWNLOAD_ASSET_REGISTRY += groot_asset_registry
     else:
         download_kitchen_assets.DOWNLOAD_ASSET_REGISTRY = groot_asset_registry
     download(bypass=bypass)
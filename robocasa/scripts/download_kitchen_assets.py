@@ -1,87 +1,299 @@
 import argparse
+import concurrent.futures
+import dataclasses
+import json
 import os
+import shutil
+import struct
 import sys
+import tempfile
+import threading
 import time
 import urllib.request
+import zipfile
 from pathlib import Path
 from zipfile import ZipFile
 
 from termcolor import colored
 from tqdm import tqdm
 
-DOWNLOAD_ASSET_REGISTRY = dict(
-    textures=dict(
+try:
+    # optional: ISA-L's crc32 and inflate are several times faster than zlib's
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+_ASSETS_ROOT = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "models", "assets")
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class AssetSource:
+    name: str
+    message: str
+    url: str
+    folder: str
+    check_folder_exists: bool = False
+
+
+DOWNLOAD_ASSET_REGISTRY = (
+    AssetSource(
+        name="textures",
         message="Downloading environment textures",
         url="https://utexas.box.com/shared/static/otdsyfjontk17jdp24bkhy2hgalofbh4.zip",
-        folder=os.path.join(os.path.dirname(__file__), "../models/assets/textures"),
-        check_folder_exists=False,
+        folder=os.path.join(_ASSETS_ROOT, "textures"),
     ),
-    fixtures=dict(
+    AssetSource(
+        name="fixtures",
         message="Downloading fixtures",
         url="https://utexas.box.com/shared/static/pobhbsjyacahg2mx8x4rm5fkz3wlmyzp.zip",
-        folder=os.path.join(os.path.dirname(__file__), "../models/assets/fixtures"),
-        check_folder_exists=False,
+        folder=os.path.join(_ASSETS_ROOT, "fixtures"),
     ),
-    objaverse=dict(
+    AssetSource(
+        name="objaverse",
         message="Downloading objaverse objects",
         url="https://utexas.box.com/shared/static/ejt1kc2v5vhae1rl4k5697i4xvpbjcox.zip",
-        folder=os.path.join(
-            os.path.dirname(__file__), "../models/assets/objects/objaverse"
-        ),
-        check_folder_exists=False,
+        folder=os.path.join(_ASSETS_ROOT, "objects", "objaverse"),
     ),
-    aigen_objs=dict(
+    AssetSource(
+        name="aigen_objs",
         message="Downloading AI-generated objects",
         url="https://utexas.box.com/shared/static/os3hrui06lasnuvwqpmwn0wcrduh6jg3.zip",
-        folder=os.path.join(
-            os.path.dirname(__file__), "../models/assets/objects/aigen_objs"
-        ),
-        check_folder_exists=False,
+        folder=os.path.join(_ASSETS_ROOT, "objects", "aigen_objs"),
     ),
-    generative_textures=dict(
+    AssetSource(
+        name="generative_textures",
         message="Downloading AI-generated environment textures",
         url="https://utexas.box.com/shared/static/gf9nkadvfrowkb9lmkcx58jwt4d6c1g3.zip",
-        folder=os.path.join(
-            os.path.dirname(__file__), "../models/assets/generative_textures"
-        ),
-        check_folder_exists=False,
+        folder=os.path.join(_ASSETS_ROOT, "generative_textures"),
     ),
 )
 
 
+# records what was last extracted for each url, used to skip redundant downloads
+DOWNLOAD_MANIFEST_PATH = os.path.join(_ASSETS_ROOT, "_download_manifest.json")
+_download_manifest_lock = threading.Lock()
+
+# number of parallel range requests used per download, and read size per request
+DOWNLOAD_NUM_CONNECTIONS = 4
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
 class DownloadProgressBar(tqdm):
+    # urlretrieve reports every 8 Kb block; only refresh the bar every 1 Mb
+    update_interval = DOWNLOAD_CHUNK_SIZE
+
     def update_to(self, b=1, bsize=1, tsize=None):
         if tsize is not None:
             self.total = tsize
-        self.update(b * bsize - self.n)
+        downloaded = b * bsize
+        if downloaded - self.n >= self.update_interval or (
+            self.total is not None and downloaded >= self.total
+        ):
+            self.update(downloaded - self.n)
 
 
-def url_is_alive(url):
+def probe_url(url):
     """
-    Checks that a given URL is reachable.
-    From https://gist.github.com/dehowell/884204.
+    Requests the first byte of @url to find out where it redirects to, how large
+    the file is and whether the server honors HTTP range requests.
 
     Args:
         url (str): url string
 
     Returns:
-        is_alive (bool): True if url is reachable, False otherwise
+        4-tuple:
+
+            - (str) resolved url after following redirects
+            - (int) total size in bytes, or None if unknown
+            - (bool) True if the server supports range requests
+            - (str) ETag of the file, or None if not provided
+    """
+    request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with urllib.request.urlopen(request) as resp:
+        resolved_url = resp.geturl()
+        etag = resp.headers.get("ETag")
+        if resp.status == 206:
+            # Content-Length is the size of the 1-byte probe here, so the total is only
+            # known if Content-Range reports it (it may be "*")
+            total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+            if total.isdigit():
+                return resolved_url, int(total), True, etag
+            return resolved_url, None, True, etag
+        length = resp.headers.get("Content-Length", "")
+        return resolved_url, int(length) if length.isdigit() else None, False, etag
+
+
+def probe_urls(urls):
     """
-    request = urllib.request.Request(url)
-    request.get_method = lambda: "HEAD"
+    Probes all @urls concurrently (see @probe_url), so that reachability and
+    file info are gathered in one round trip instead of one per download.
+
+    Args:
+        urls (list of str): url strings
+
+    Returns:
+        dict: maps each url to its @probe_url result, or None if unreachable
+    """
+
+    def _probe(url):
+        try:
+            return probe_url(url)
+        except (OSError, ValueError):
+            return None
+
+    if len(urls) == 0:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return dict(zip(urls, executor.map(_probe, urls)))
 
+
+def load_download_manifest():
+    """
+    Returns:
+        dict: maps each downloaded url to info about the extracted archive
+    """
+    if not os.path.exists(DOWNLOAD_MANIFEST_PATH):
+        return {}
     try:
-        urllib.request.urlopen(request)
-        return True
-    except urllib.request.HTTPError:
+        with open(DOWNLOAD_MANIFEST_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def update_download_manifest(url, entry):
+    """
+    Records @entry for @url in the download manifest. The manifest is written to a
+    temporary file that then replaces it, so an interrupted write can't lose the
+    other entries.
+    """
+    with _download_manifest_lock:
+        manifest = load_download_manifest()
+        manifest[url] = entry
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(DOWNLOAD_MANIFEST_PATH), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(manifest, f, indent=4)
+            os.replace(tmp_path, DOWNLOAD_MANIFEST_PATH)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+def is_download_up_to_date(url, folder, etag, length):
+    """
+    Checks whether the archive at @url was already extracted into @folder
+    and the remote file still matches what was downloaded then.
+
+    Args:
+        url (str): url string
+        folder (str): folder the archive extracts into
+        etag (str): current ETag of the remote file, may be None
+        length (int): current size of the remote file, may be None
+
+    Returns:
+        bool: True if the download can be skipped
+    """
+    if etag is None and length is None:
+        return False
+    if not os.path.isdir(folder) or len(os.listdir(folder)) == 0:
+        return False
+    with _download_manifest_lock:
+        entry = load_download_manifest().get(url)
+    if entry is None:
         return False
+    return entry.get("etag") == etag and entry.get("length") == length
 
 
-def download_url(url, download_dir, fname=None, check_overwrite=True):
+class _RangeRequestIgnoredError(IOError):
     """
-    First checks that @url is reachable, then downloads the file
-    at that url into the directory specified by @download_dir.
-    Prints a progress bar during the download using tqdm.
+    Raised when a server answers a range request with something other than a 206
+    """
+
+
+def _download_range(url, file_to_write, start, end, t, lock):
+    """
+    Downloads bytes [@start, @end] of @url into the same offsets of @file_to_write,
+    which must already exist, and reports progress to tqdm bar @t under @lock.
+    """
+    request = urllib.request.Request(
+        url, headers={"Range": "bytes={}-{}".format(start, end)}
+    )
+    with urllib.request.urlopen(request) as resp, open(file_to_write, "r+b") as f:
+        if resp.status != 206:
+            raise _RangeRequestIgnoredError(
+                "Server ignored range request for {}".format(url)
+            )
+        f.seek(start)
+        written = 0
+        while True:
+            chunk = resp.read(DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            written += len(chunk)
+            with lock:
+                t.update(len(chunk))
+    # a dropped connection ends the read early without an error, which would leave
+    # a hole in the preallocated file
+    if written != end - start + 1:
+        raise IOError(
+            "Retrieval incomplete: got only {} out of {} bytes of {}".format(
+                written, end - start + 1, url
+            )
+        )
+
+
+def download_url_ranges(url, file_to_write, total, t):
+    """
+    Downloads @url into @file_to_write by splitting it into DOWNLOAD_NUM_CONNECTIONS
+    byte ranges that are fetched in parallel and written at their offsets.
+
+    Args:
+        url (str): url string (should already be resolved, see @probe_url)
+        file_to_write (str): path of the output file
+        total (int): total size of the file in bytes
+        t (DownloadProgressBar): progress bar to update
+    """
+    # preallocate the output so each part can be written at its own offset
+    with open(file_to_write, "wb") as f:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, total)
+        else:
+            f.truncate(total)
+
+    part_size = -(-total // DOWNLOAD_NUM_CONNECTIONS)
+    lock = threading.Lock()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=DOWNLOAD_NUM_CONNECTIONS
+    ) as executor:
+        futures = [
+            executor.submit(
+                _download_range,
+                url,
+                file_to_write,
+                start,
+                min(start + part_size, total) - 1,
+                t,
+                lock,
+            )
+            for start in range(0, total, part_size)
+        ]
+        for future in futures:
+            future.result()
+
+
+def download_url(
+    url, download_dir, fname=None, check_overwrite=True, position=None, url_info=None
+):
+    """
+    Downloads the file at @url into the directory specified by @download_dir.
+    Prints a progress bar during the download using tqdm. If the server supports
+    range requests the file is fetched over several connections in parallel.
 
     Modified from https://github.com/tqdm/tqdm#hooks-and-callbacks, and
     https://stackoverflow.com/a/53877507.
@@ -91,12 +303,9 @@ def download_url(url, download_dir, fname=None, check_overwrite=True):
         download_dir (str): path to directory where file should be downloaded
         check_overwrite (bool): if True, will sanity check the download fpath to make sure a file of that name
             doesn't already exist there
+        position (int): line offset of the progress bar, used to keep concurrent downloads from clashing
+        url_info (tuple): result of @probe_url for this url, if already known
     """
-
-    # check if url is reachable. We need the sleep to make sure server doesn't reject subsequent requests
-    # assert url_is_alive(url), "@download_url got unreachable url: {}".format(url)
-    # time.sleep(0.5)
-
     if fname is None:
         # infer filename from url link
         fname = url.split("/")[-1]
@@ -115,20 +324,127 @@ def download_url(url, download_dir, fname=None, check_overwrite=True):
 
     print(colored(f"Downloading to {file_to_write}", "yellow"))
 
-    with DownloadProgressBar(unit="B", unit_scale=True, miniters=1, desc=fname) as t:
+    with DownloadProgressBar(
+        unit="B", unit_scale=True, miniters=1, desc=fname, position=position
+    ) as t:
+        if url_info is None:
+            url_info = probe_url(url)
+        resolved_url, total, supports_ranges, _ = url_info
+        if supports_ranges and total is not None and total > DOWNLOAD_CHUNK_SIZE:
+            t.total = total
+            try:
+                download_url_ranges(resolved_url, file_to_write, total, t)
+                return
+            except _RangeRequestIgnoredError:
+                # the server sent the whole file for a part, so download it in one
+                # stream instead
+                t.reset(total=total)
         urllib.request.urlretrieve(url, filename=file_to_write, reporthook=t.update_to)
 
 
+# layout of a zip local file header, as in zipfile
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+def _inflate_zip_member(archive, member, dst):
+    """
+    Decompresses the ZIP_DEFLATED @member of the zip file object @archive into @dst
+    with ISA-L, reading its compressed bytes straight from the archive, and checks
+    its crc32.
+
+    Args:
+        archive (file): zip archive opened in binary mode
+        member (ZipInfo): member to extract
+        dst (file): file to write the decompressed contents to
+    """
+    archive.seek(member.header_offset)
+    header = _ZIP_LOCAL_HEADER.unpack(archive.read(_ZIP_LOCAL_HEADER.size))
+    if header[0] != b"PK\x03\x04":
+        raise zipfile.BadZipFile("Bad file header for {}".format(member.filename))
+    # skip the file name and extra field that follow the header
+    archive.seek(header[10] + header[11], os.SEEK_CUR)
+
+    decompressor = isal_zlib.decompressobj(-15)
+    crc = 0
+    remaining = member.compress_size
+    while remaining > 0:
+        chunk = archive.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated data for {}".format(member.filename))
+        remaining -= len(chunk)
+        # bound the output per call, highly compressed data can expand a lot
+        while chunk:
+            data = decompressor.decompress(chunk, DOWNLOAD_CHUNK_SIZE)
+            crc = isal_zlib.crc32(data, crc)
+            dst.write(data)
+            chunk = decompressor.unconsumed_tail
+    data = decompressor.flush()
+    crc = isal_zlib.crc32(data, crc)
+    dst.write(data)
+
+    if crc != member.CRC:
+        raise zipfile.BadZipFile("Bad CRC-32 for {}".format(member.filename))
+
+
+def extract_zip(zip_ref, path, archive=None):
+    """
+    Extracts all members of @zip_ref into @path. Equivalent to ZipFile.extractall,
+    but copies file contents in DOWNLOAD_CHUNK_SIZE blocks rather than zipfile's
+    small default buffer, which cuts down on syscalls for multi-Gb archives.
+    If the optional isal package is installed and the file object @zip_ref was
+    opened from is given as @archive, deflated members are decompressed with
+    ISA-L, which is several times faster than zlib.
+
+    Args:
+        zip_ref (ZipFile): open zip archive
+        path (str): directory to extract into
+        archive (file): file object @zip_ref was opened from, if any
+    """
+    use_isal = isal_zlib is not None and archive is not None
+
+    invalid_path_parts = ("", os.path.curdir, os.path.pardir)
+    for member in zip_ref.infolist():
+        # sanitize the member path the same way ZipFile.extract does
+        arcname = member.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        arcname = os.path.sep.join(
+            x for x in arcname.split(os.path.sep) if x not in invalid_path_parts
+        )
+        target = os.path.join(path, arcname)
+
+        if member.is_dir():
+            os.makedirs(target, exist_ok=True)
+            continue
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as dst:
+            # encrypted members (flag bit 0) are left to zipfile
+            if (
+                use_isal
+                and member.compress_type == zipfile.ZIP_DEFLATED
+                and not member.flag_bits & 0x1
+            ):
+                _inflate_zip_member(archive, member, dst)
+            else:
+                with zip_ref.open(member) as src:
+                    shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+
 def download_and_extract_zip(
     url,
     folder,
     check_folder_exists=True,
     prompt_before_download=False,
     message="Downloading...",
+    position=None,
+    url_info=None,
 ):
     assert url.endswith(".zip")
 
-    download_dir = os.path.abspath(os.path.join(folder, os.pardir))
+    # registry folders are already normalized, so the parent is just the dirname
+    download_dir = os.path.dirname(folder)
     Path(download_dir).mkdir(parents=True, exist_ok=True)
 
     download_path = os.path.join(
@@ -137,6 +453,19 @@ def download_and_extract_zip(
 
     print(colored(message, "yellow"))
 
+    if url_info is None:
+        try:
+            url_info = probe_url(url)
+        except (OSError, ValueError):
+            pass
+    if url_info is not None:
+        _, remote_length, _, remote_etag = url_info
+    else:
+        remote_length, remote_etag = None, None
+    if is_download_up_to_date(url, folder, remote_etag, remote_length):
+        print(colored("{} is already up to date. Skipping.\n".format(folder), "yellow"))
+        return
+
     # extract files
     if check_folder_exists and os.path.exists(folder):
         ans = input("{} already exists! \noverwrite? (y/n) ".format(folder))
@@ -166,6 +495,8 @@ def download_and_extract_zip(
                 download_dir=download_dir,
                 fname=os.path.basename(download_path),
                 check_overwrite=False,
+                position=position,
+                url_info=url_info,
             )
             download_success = True
             break
@@ -177,13 +508,28 @@ def download_and_extract_zip(
         return
 
     print(colored("Extracting...", "yellow"))
-    with ZipFile(download_path, "r") as zip_ref:
+    with open(download_path, "rb") as archive, ZipFile(archive, "r") as zip_ref:
+        # on POSIX the open handle keeps the archive readable after unlinking,
+        # so the zip is reclaimed as soon as extraction finishes (or fails)
+        if os.name == "posix":
+            os.remove(download_path)
         # Extracting all the members of the zip
         # into a specific location.
-        zip_ref.extractall(path=download_dir)
+        extract_zip(zip_ref, download_dir, archive=archive)
 
     # delete zip file
-    os.remove(download_path)
+    if os.path.exists(download_path):
+        os.remove(download_path)
+
+    update_download_manifest(
+        url,
+        dict(
+            etag=remote_etag,
+            length=remote_length,
+            extracted_to=os.path.abspath(folder),
+            mtime=time.time(),
+        ),
+    )
 
     print(colored("Done.\n", "yellow"))
 
@@ -199,10 +545,42 @@ def download_kitchen_assets(bypass=False):
         print("Aborting.")
         return
 
-    for ds_name, config in DOWNLOAD_ASSET_REGISTRY.items():
-        if ds_name == "aigen_objs":
-            continue  # skip for now, too large to download initially
-        download_and_extract_zip(**config)
+    tasks = [
+        src
+        for src in DOWNLOAD_ASSET_REGISTRY
+        # skip aigen_objs for now, too large to download initially
+        if src.name != "aigen_objs"
+    ]
+    if len(tasks) == 0:
+        return
+
+    # check all urls up front, and reuse the results for each download
+    url_infos = probe_urls([src.url for src in tasks])
+    for src in tasks:
+        if url_infos[src.url] is None:
+            print(colored("Could not reach {}. Skipping.".format(src.url), "red"))
+    tasks = [src for src in tasks if url_infos[src.url] is not None]
+    if len(tasks) == 0:
+        return
+
+    # assets go to separate folders, so download them concurrently
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(4, len(tasks))
+    ) as executor:
+        futures = [
+            executor.submit(
+                download_and_extract_zip,
+                src.url,
+                src.folder,
+                check_folder_exists=src.check_folder_exists,
+                message=src.message,
+                position=i,
+                url_info=url_infos[src.url],
+            )
+            for i, src in enumerate(tasks)
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
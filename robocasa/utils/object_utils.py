@@ -1,7 +1,10 @@
+import weakref
+
 import numpy as np
 import mujoco as mj
 import robosuite.utils.transform_utils as T
 from robosuite.utils.mjcf_utils import array_to_string
+from robosuite.utils.numba import jit_decorator
 
 from robocasa.models.objects.objects import MJCFObject
 
@@ -179,6 +182,57 @@ def point_in_fixture(point, fixture, only_2d=False):
         return check1 and check2 and check3
 
 
+# geometry of objects used by the placement checks, computed lazily. it is derived
+# from the objects' xml, so it has to be invalidated when that changes
+_obj_geom_cache = weakref.WeakKeyDictionary()
+
+
+def invalidate_obj_geometry(obj):
+    """
+    drop the cached geometry of an object. must be called when the object's bounding
+    sites or scale change
+    """
+    _obj_geom_cache.pop(obj, None)
+
+
+def _cached_obj_geometry(obj, key, compute):
+    geom = _obj_geom_cache.get(obj)
+    if geom is None:
+        geom = _obj_geom_cache[obj] = {}
+    if key not in geom:
+        geom[key] = compute(obj)
+    return geom[key]
+
+
+def _obj_attr(obj, name):
+    return _cached_obj_geometry(obj, name, lambda o: getattr(o, name))
+
+
+def obj_bbox_offsets(obj):
+    """
+    get the 8 bounding box points of the object relative to its origin, in its own
+    frame. None if the object doesn't have a bounding box
+    """
+    from robocasa.models.fixtures import Fixture
+
+    def compute(obj):
+        if isinstance(obj, MJCFObject) or isinstance(obj, Fixture):
+            obj_points = obj.get_bbox_points(
+                trans=np.zeros(3), rot=np.array([0, 0, 0, 1])
+            )
+            return np.array(obj_points, dtype=float)
+        return None
+
+    return _cached_obj_geometry(obj, "bbox_offsets", compute)
+
+
+def _obj_bbox_points(obj, obj_pos, obj_quat):
+    # same as obj.get_bbox_points(trans=obj_pos, rot=obj_quat), from the cached offsets
+    if obj_pos is None or obj_quat is None:
+        return obj.get_bbox_points(trans=obj_pos, rot=obj_quat)
+    return obj_bbox_offsets(obj) @ T.quat2mat(obj_quat).T + obj_pos
+
+
 def obj_in_region(
     obj,
     obj_pos,
@@ -195,9 +249,9 @@ def obj_in_region(
     from robocasa.models.fixtures import Fixture
 
     if isinstance(obj, MJCFObject) or isinstance(obj, Fixture):
-        obj_points = obj.get_bbox_points(trans=obj_pos, rot=obj_quat)
+        obj_points = _obj_bbox_points(obj, obj_pos, obj_quat)
     else:
-        radius = obj.horizontal_radius
+        radius = _obj_attr(obj, "horizontal_radius")
         obj_points = obj_pos + np.array(
             [
                 [radius, 0, 0],
@@ -226,6 +280,86 @@ def obj_in_region(
     return True
 
 
+def obj_region_offsets(obj):
+    """
+    get the points used by obj_in_region, relative to the object's origin, and whether
+    they rotate with the object (bounding box points) or not (horizontal radius points)
+    """
+    from robocasa.models.fixtures import Fixture
+
+    if isinstance(obj, MJCFObject) or isinstance(obj, Fixture):
+        return obj_bbox_offsets(obj), True
+    else:
+        radius = _obj_attr(obj, "horizontal_radius")
+        obj_points = np.array(
+            [
+                [radius, 0, 0],
+                [-radius, 0, 0],
+                [0, radius, 0],
+                [0, -radius, 0],
+            ],
+            dtype=float,
+        )
+        return obj_points, False
+
+
+@jit_decorator
+def _first_obj_in_region(start, obj_pos, obj_quat, obj_offsets, rotate, p0, px, py):
+    u = px - p0
+    v = py - p0
+    u_lo, u_hi = np.dot(u, p0), np.dot(u, px)
+    v_lo, v_hi = np.dot(v, p0), np.dot(v, py)
+
+    rot = np.identity(3)
+    for i in range(start, obj_pos.shape[0]):
+        if rotate:
+            rot = T.quat2mat(obj_quat[i])
+        inside = True
+        for j in range(obj_offsets.shape[0]):
+            point = np.dot(rot, obj_offsets[j]) + obj_pos[i]
+            if not (u_lo <= np.dot(u, point) <= u_hi):
+                inside = False
+                break
+            if not (v_lo <= np.dot(v, point) <= v_hi):
+                inside = False
+                break
+        if inside:
+            return i
+    return -1
+
+
+def first_obj_in_region(
+    obj_offsets, obj_pos, obj_quat, p0, px, py, start=0, rotate=True
+):
+    """
+    batched version of obj_in_region: scans candidate poses of an object in order and
+    returns the index of the first one for which the object is in the region defined
+    by the points, or -1 if there is none
+
+    Args:
+        obj_offsets (np.array): (K, 3) object points relative to its origin, as
+            returned by obj_region_offsets
+        obj_pos (np.array): (N, 3) candidate object positions
+        obj_quat (np.array): (N, 4) candidate object rotations, (x,y,z,w)
+        p0, px, py (np.array): points defining the region
+        start (int): index of the first candidate to check
+        rotate (bool): whether the points rotate with the object
+
+    Returns:
+        int: index of the first candidate in the region, or -1
+    """
+    return _first_obj_in_region(
+        start,
+        np.ascontiguousarray(obj_pos, dtype=float),
+        np.ascontiguousarray(obj_quat, dtype=float),
+        np.ascontiguousarray(obj_offsets, dtype=float),
+        rotate,
+        np.asarray(p0, dtype=float),
+        np.asarray(px, dtype=float),
+        np.asarray(py, dtype=float),
+    )
+
+
 def obj_in_region_with_keypoints(
     obj, obj_pos, obj_quat, region_points, min_num_points=3, region_type="box"
 ):
@@ -327,10 +461,8 @@ def objs_intersect(
         isinstance(other_obj, MJCFObject) or isinstance(other_obj, Fixture)
     )
     if bbox_check:
-        obj_points = obj.get_bbox_points(trans=obj_pos, rot=obj_quat)
-        other_obj_points = other_obj.get_bbox_points(
-            trans=other_obj_pos, rot=other_obj_quat
-        )
+        obj_points = _obj_bbox_points(obj, obj_pos, obj_quat)
+        other_obj_points = _obj_bbox_points(other_obj, other_obj_pos, other_obj_quat)
 
         face_normals = [
             obj_points[1] - obj_points[0],
@@ -362,17 +494,23 @@ def objs_intersect(
         """
         obj_x, obj_y, obj_z = obj_pos
         other_obj_x, other_obj_y, other_obj_z = other_obj_pos
+        obj_radius = _obj_attr(obj, "horizontal_radius")
+        other_obj_radius = _obj_attr(other_obj, "horizontal_radius")
         xy_collision = (
             np.linalg.norm((obj_x - other_obj_x, obj_y - other_obj_y))
-            <= other_obj.horizontal_radius + obj.horizontal_radius
+            <= other_obj_radius + obj_radius
         )
         if obj_z > other_obj_z:
             z_collision = (
-                obj_z - other_obj_z <= other_obj.top_offset[-1] - obj.bottom_offset[-1]
+                obj_z - other_obj_z
+                <= _obj_attr(other_obj, "top_offset")[-1]
+                - _obj_attr(obj, "bottom_offset")[-1]
             )
         else:
             z_collision = (
-                other_obj_z - obj_z <= obj.top_offset[-1] - other_obj.bottom_offset[-1]
+                other_obj_z - obj_z
+                <= _obj_attr(obj, "top_offset")[-1]
+                - _obj_attr(other_obj, "bottom_offset")[-1]
             )
 
         if xy_collision and z_collision:
@@ -383,6 +521,47 @@ def objs_intersect(
     return intersect
 
 
+def obj_bounding_radius(obj):
+    """
+    get the radius of a vertical cylinder around the object's origin that contains the
+    object in any orientation. two objects whose xy distance exceeds the sum of their
+    bounding radii are guaranteed not to intersect according to objs_intersect
+    """
+    from robocasa.models.fixtures import Fixture
+
+    if isinstance(obj, MJCFObject) or isinstance(obj, Fixture):
+        radius = max(np.linalg.norm(p) for p in obj_bbox_offsets(obj))
+        # objs_intersect falls back to horizontal radii against non-bbox objects
+        try:
+            radius = max(radius, _obj_attr(obj, "horizontal_radius"))
+        except AttributeError:
+            pass
+    else:
+        radius = _obj_attr(obj, "horizontal_radius")
+
+    return radius
+
+
+def obj_region_margin(obj):
+    """
+    get a lower bound on how far the object extends from its origin along any
+    horizontal direction, over all orientations. obj_in_region can only hold if the
+    object's origin is at least this far inside the region
+    """
+    from robocasa.models.fixtures import Fixture
+
+    if isinstance(obj, MJCFObject) or isinstance(obj, Fixture):
+        obj_points = obj_bbox_offsets(obj)
+        # a box extends at least its smallest half size along any direction,
+        # measured from its center, which may be offset from the origin
+        center = np.mean(obj_points, axis=0)
+        half_size = (np.max(obj_points, axis=0) - np.min(obj_points, axis=0)) / 2
+        return max(np.min(half_size) - np.linalg.norm(center), 0.0)
+    else:
+        # the 4 radius points are axis aligned, so they always span at least r / sqrt(2)
+        return _obj_attr(obj, "horizontal_radius") / np.sqrt(2)
+
+
 def normalize_joint_value(raw, joint_min, joint_max):
     """
     normalize raw value to be between 0 and 1
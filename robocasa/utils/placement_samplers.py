@@ -1,4 +1,6 @@
 import collections
+import itertools
+import math
 from copy import copy
 
 import numpy as np
@@ -6,20 +8,78 @@ import numpy as np
 from robocasa.models.objects.objects import MJCFObject
 from robosuite.models.objects import MujocoObject
 from robosuite.utils import RandomizationError
-from robosuite.utils.transform_utils import (
-    convert_quat,
-    euler2mat,
-    mat2quat,
-    quat_multiply,
-    rotate_2d_point,
-)
+from robosuite.utils.transform_utils import convert_quat
 
 from robocasa.utils.object_utils import (
+    first_obj_in_region,
+    obj_bounding_radius,
     obj_in_region,
+    obj_region_margin,
+    obj_region_offsets,
     objs_intersect,
     obj_in_region_with_keypoints,
 )
 
+# quantities derived from a UniformRandomSampler's x_range, y_range and reference_rot:
+# the p0, px and py boundary points of the region relative to the reference position,
+# the (2, 2) matrix rotating relative xy points by reference_rot, the (min, max) x and
+# y bounds of the region and the reference rotation as an (x,y,z,w) quat
+_SamplingRegion = collections.namedtuple(
+    "_SamplingRegion", ["points", "rot_mat", "x_bounds", "y_bounds", "quat_xyzw"]
+)
+
+
+def _quat_multiply_batch(quaternion1, quaternion0):
+    """
+    Vectorized version of robosuite's quat_multiply (q1 * q0). Either argument may be a
+    single (x,y,z,w) quaternion or an (N, 4) array of them. Like quat_multiply, the
+    result is rounded to float32.
+
+    Returns:
+        np.array: (x,y,z,w) multiplied quaternion(s)
+    """
+    x0, y0, z0, w0 = np.moveaxis(np.asarray(quaternion0, dtype=float), -1, 0)
+    x1, y1, z1, w1 = np.moveaxis(np.asarray(quaternion1, dtype=float), -1, 0)
+    return np.stack(
+        (
+            x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+            -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+            x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+            -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
+        ),
+        axis=-1,
+    ).astype(np.float32)
+
+
+def _grid_cell(cell_size, x, y):
+    """
+    Returns the integer coordinates of the grid cell containing the point (x, y)
+    """
+    return math.floor(x / cell_size), math.floor(y / cell_size)
+
+
+def _grid_neighbors(grid, cell_size, x, y):
+    """
+    Yields the entries of @grid (mapping integer cell coordinates to lists) in the 3x3
+    cells around the point (x, y)
+    """
+    cx, cy = _grid_cell(cell_size, x, y)
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            yield from grid.get((gx, gy), ())
+
+
+def _attempt_batch_sizes(num_attempts, initial_size=64):
+    """
+    Splits @num_attempts placement attempts into batches, starting at @initial_size
+    attempts and doubling the batch size every time
+    """
+    size = initial_size
+    while num_attempts > 0:
+        yield min(size, num_attempts)
+        num_attempts -= size
+        size *= 2
+
 
 class ObjectPositionSampler:
     """
@@ -213,6 +273,25 @@ class UniformRandomSampler(ObjectPositionSampler):
         self.rotation = rotation
         self.rotation_axis = rotation_axis
         self.num_attempts = num_attempts
+
+        # resolve the structure of @rotation once, so sampling doesn't need to inspect it
+        if rotation is None:
+            self._rot_mode = "uniform_2pi"
+        elif isinstance(rotation, collections.abc.Iterable):
+            if isinstance(rotation[0], collections.abc.Iterable):
+                self._rot_mode = "choice_of_ranges"
+                rot_ranges = np.array(rotation, dtype=float)
+                self._rot_low = rot_ranges.min(axis=1)
+                self._rot_high = rot_ranges.max(axis=1)
+            else:
+                self._rot_mode = "range"
+                self._rot_low, self._rot_high = min(rotation), max(rotation)
+        else:
+            self._rot_mode = "fixed"
+        # index of the rotation axis in a (w,x,y,z) quat. None if invalid, which is
+        # reported when sampling
+        self._axis_idx = {"x": 1, "y": 2, "z": 3}.get(rotation_axis)
+
         if side not in self.valid_sides:
             raise ValueError(
                 "Invalid value for side, must be one of:", self.valid_sides
@@ -231,6 +310,87 @@ class UniformRandomSampler(ObjectPositionSampler):
         self.ensure_object_in_ref_region = ensure_object_in_ref_region
         self.ensure_object_out_of_ref_region = ensure_object_out_of_ref_region
 
+    # x_range, y_range and reference_rot are properties so that changing any of them
+    # drops the sampling region derived from them, see _get_region
+    @property
+    def x_range(self):
+        return self._x_range
+
+    @x_range.setter
+    def x_range(self, x_range):
+        self._x_range = x_range
+        self._region = None
+
+    @property
+    def y_range(self):
+        return self._y_range
+
+    @y_range.setter
+    def y_range(self, y_range):
+        self._y_range = y_range
+        self._region = None
+
+    @property
+    def reference_rot(self):
+        return self._reference_rot
+
+    @reference_rot.setter
+    def reference_rot(self, reference_rot):
+        self._reference_rot = reference_rot
+        self._region = None
+
+    def _get_region(self):
+        """
+        Returns the sampling region of this sampler. It is computed on first use and
+        again after x_range, y_range or reference_rot change
+
+        Returns:
+            _SamplingRegion: region derived from x_range, y_range and reference_rot
+        """
+        if self._region is None:
+            self._region = self._compute_region(self.x_range, self.y_range)
+        return self._region
+
+    def _compute_region(self, x_range, y_range):
+        """
+        Computes the sampling region spanned by @x_range and @y_range, rotated by this
+        sampler's reference rotation
+
+        Args:
+            x_range (2-array of float): (min, max) relative x range of the region
+
+            y_range (2-array of float): (min, max) relative y range of the region
+
+        Returns:
+            _SamplingRegion: the region
+        """
+        cos_r, sin_r = math.cos(self.reference_rot), math.sin(self.reference_rot)
+        rot_mat = np.array([[cos_r, sin_r], [-sin_r, cos_r]])
+        region_points = np.array(
+            [
+                [x_range[0], y_range[0], 0],
+                [x_range[1], y_range[0], 0],
+                [x_range[0], y_range[1], 0],
+            ],
+            dtype=float,
+        )
+        region_points[:, 0:2] = region_points[:, 0:2] @ rot_mat
+
+        # reference rotation about the z axis, as a quat. (the sign is chosen so that w is
+        # non-negative, like mat2quat does)
+        half_rot = 0.5 * self.reference_rot
+        ref_quat_wxyz = np.array([math.cos(half_rot), 0, 0, math.sin(half_rot)])
+        if ref_quat_wxyz[0] < 0:
+            ref_quat_wxyz = -ref_quat_wxyz
+
+        return _SamplingRegion(
+            points=region_points,
+            rot_mat=rot_mat,
+            x_bounds=(min(x_range), max(x_range)),
+            y_bounds=(min(y_range), max(y_range)),
+            quat_xyzw=ref_quat_wxyz[[1, 2, 3, 0]],
+        )
+
     def _sample_x(self):
         """
         Samples the x location for a given object
@@ -261,31 +421,85 @@ class UniformRandomSampler(ObjectPositionSampler):
         Raises:
             ValueError: [Invalid rotation axis]
         """
-        if self.rotation is None:
+        if self._rot_mode == "uniform_2pi":
             rot_angle = self.rng.uniform(high=2 * np.pi, low=0)
-        elif isinstance(self.rotation, collections.abc.Iterable):
-            if isinstance(self.rotation[0], collections.abc.Iterable):
-                rotation = self.rng.choice(self.rotation)
-            else:
-                rotation = self.rotation
+        elif self._rot_mode == "choice_of_ranges":
+            rotation = self.rng.choice(self.rotation)
             rot_angle = self.rng.uniform(high=max(rotation), low=min(rotation))
+        elif self._rot_mode == "range":
+            rot_angle = self.rng.uniform(high=self._rot_high, low=self._rot_low)
         else:
             rot_angle = self.rotation
 
         # Return angle based on axis requested
-        if self.rotation_axis == "x":
-            return np.array([np.cos(rot_angle / 2), np.sin(rot_angle / 2), 0, 0])
-        elif self.rotation_axis == "y":
-            return np.array([np.cos(rot_angle / 2), 0, np.sin(rot_angle / 2), 0])
-        elif self.rotation_axis == "z":
-            return np.array([np.cos(rot_angle / 2), 0, 0, np.sin(rot_angle / 2)])
+        if self._axis_idx is None:
+            # Invalid axis specified, raise error
+            raise ValueError(
+                "Invalid rotation axis specified. Must be 'x', 'y', or 'z'. Got: {}".format(
+                    self.rotation_axis
+                )
+            )
+        # scalar trig through math is much cheaper than through numpy ufuncs
+        quat = np.zeros(4)
+        quat[0] = math.cos(rot_angle / 2)
+        quat[self._axis_idx] = math.sin(rot_angle / 2)
+        return quat
+
+    def _sample_xy_batch(self, num):
+        """
+        Samples the x and y locations for @num placement attempts at once
+
+        Args:
+            num (int): number of samples to draw
+
+        Returns:
+            np.array: (num, 2) array of sampled (x, y) positions
+        """
+        return self.rng.uniform(
+            low=(self.x_range[0], self.y_range[0]),
+            high=(self.x_range[1], self.y_range[1]),
+            size=(num, 2),
+        )
+
+    def _sample_quat_batch(self, num):
+        """
+        Samples the orientations for @num placement attempts at once
+
+        Args:
+            num (int): number of samples to draw
+
+        Returns:
+            np.array: (num, 4) array of sampled object quaternions in (w,x,y,z) form
+
+        Raises:
+            ValueError: [Invalid rotation axis]
+        """
+        if self._rot_mode == "uniform_2pi":
+            rot_angles = self.rng.uniform(high=2 * np.pi, low=0, size=num)
+        elif self._rot_mode == "choice_of_ranges":
+            # pick one of the ranges per sample, then sample within it
+            choices = self.rng.integers(len(self._rot_low), size=num)
+            rot_angles = self.rng.uniform(
+                high=self._rot_high[choices], low=self._rot_low[choices]
+            )
+        elif self._rot_mode == "range":
+            rot_angles = self.rng.uniform(
+                high=self._rot_high, low=self._rot_low, size=num
+            )
         else:
+            rot_angles = np.full(num, self.rotation, dtype=float)
+
+        if self._axis_idx is None:
             # Invalid axis specified, raise error
             raise ValueError(
                 "Invalid rotation axis specified. Must be 'x', 'y', or 'z'. Got: {}".format(
                     self.rotation_axis
                 )
             )
+        quats = np.zeros((num, 4))
+        quats[:, 0] = np.cos(rot_angles / 2)
+        quats[:, self._axis_idx] = np.sin(rot_angles / 2)
+        return quats
 
     def sample(
         self, placed_objects=None, reference=None, neg_reference=None, on_top=True
@@ -363,6 +577,60 @@ class UniformRandomSampler(ObjectPositionSampler):
                 base_offset
             )
 
+        # get the sampling region, rotated by the reference rotation
+        region = self._get_region()
+
+        ### get boundary points ###
+        region_points = region.points + base_offset
+        base_x, base_y, base_z = base_offset
+
+        if self.ensure_valid_placement:
+            # placed objects as parallel arrays / lists (extended as objects get placed
+            # below), so the overlap checks can index them directly
+            num_placed = len(placed_objects)
+            capacity = num_placed + len(self.mujoco_objects)
+            placed_objs = [other_obj for _, _, other_obj in placed_objects.values()]
+            placed_xyzw = [
+                convert_quat(quat, to="xyzw") for _, quat, _ in placed_objects.values()
+            ]
+            placed_pos = np.empty((capacity, 3))
+            placed_pos[:num_placed] = np.fromiter(
+                itertools.chain.from_iterable(
+                    pos for pos, _, _ in placed_objects.values()
+                ),
+                dtype=float,
+                count=3 * num_placed,
+            ).reshape(-1, 3)
+            placed_r = np.empty(capacity)
+            placed_r[:num_placed] = [obj_bounding_radius(o) for o in placed_objs]
+            # (newly placed objects are never the spawn reference)
+            spawn_ref_ks = np.flatnonzero(
+                [
+                    spawn_ref_obj is not None and other_obj == spawn_ref_obj
+                    for other_obj in placed_objs
+                ]
+            )
+
+        # the reference objects don't move during sampling, so the bounding box points of
+        # their regions only need to be computed once
+        if self.ensure_object_in_ref_region and reference is not None:
+            _ref_pos, _ref_quat, _ref_obj = placed_objects[reference]
+            ref_region_points = _ref_obj.get_bbox_points(trans=_ref_pos, rot=_ref_quat)[
+                :3
+            ]
+        if self.ensure_object_out_of_ref_region and neg_reference is not None:
+            neg_ref_region_points = []
+            for nf in neg_reference:
+                assert (
+                    nf in placed_objects
+                ), "Invalid negative reference received. Current options are: {}, requested: {}".format(
+                    placed_objects.keys(), nf
+                )
+                _ref_pos, _ref_quat, _ref_obj = placed_objects[nf]
+                neg_ref_region_points.append(
+                    _ref_obj.get_bbox_points(trans=_ref_pos, rot=_ref_quat)[:3]
+                )
+
         # Sample pos and quat for all objects assigned to this sampler
         for obj in self.mujoco_objects:
             # First make sure the currently sampled object hasn't already been sampled
@@ -372,139 +640,188 @@ class UniformRandomSampler(ObjectPositionSampler):
 
             success = False
 
-            # get reference rotation
-            ref_quat = convert_quat(
-                mat2quat(euler2mat([0, 0, self.reference_rot])), to="wxyz"
-            )
-
-            ### get boundary points ###
-            region_points = np.array(
-                [
-                    [self.x_range[0], self.y_range[0], 0],
-                    [self.x_range[1], self.y_range[0], 0],
-                    [self.x_range[0], self.y_range[1], 0],
-                ]
-            )
-            for i in range(len(region_points)):
-                region_points[i][0:2] = rotate_2d_point(
-                    region_points[i][0:2], rot=self.reference_rot
+            init_quat = getattr(obj, "init_quat", None)
+            object_z = self.z_offset + base_z
+            if on_top:
+                object_z -= obj.bottom_offset[-1]
+
+            if self.ensure_object_boundary_in_range:
+                # the object's origin has to be at least this far inside the region
+                margin = obj_region_margin(obj) - 1e-9
+                x_lo, x_hi = region.x_bounds
+                y_lo, y_hi = region.y_bounds
+                obj_offsets, rotate = obj_region_offsets(obj)
+
+            if self.ensure_valid_placement:
+                r_self = obj_bounding_radius(obj)
+                # objects whose bounding circles don't overlap cannot intersect, so only
+                # nearby objects need the exact check. bin the placed objects into a grid
+                # with cells no smaller than any overlap distance, so that all objects
+                # near an attempt are in the 3x3 cells around it
+                placed_xy = placed_pos[:num_placed, 0:2].tolist()
+                near_dist_sq = ((r_self + placed_r[:num_placed]) ** 2).tolist()
+                cell_size = max(r_self + placed_r[:num_placed].max(initial=0.0), 1e-6)
+                grid = collections.defaultdict(list)
+                for k, (x, y) in enumerate(placed_xy):
+                    if k not in spawn_ref_ks:
+                        grid[_grid_cell(cell_size, x, y)].append(k)
+
+            # attempts are drawn in batches of growing size, so that easy placements
+            # don't pay for drawing and filtering the full attempt budget
+            stop = False
+            for num in _attempt_batch_sizes(self.num_attempts):
+                # draw object coordinates and random rotations for the batch at once
+                relative_xy = self._sample_xy_batch(num)
+                sampled_quats = self._sample_quat_batch(num)
+                # multiply the quats by the object's initial rotation if it has the attribute specified
+                if init_quat is not None:
+                    sampled_quats = _quat_multiply_batch(sampled_quats, init_quat)
+                # then apply the reference rotation; [1, 2, 3, 0] converts (w,x,y,z) ->
+                # (x,y,z,w) for the whole batch. quats stay in (x,y,z,w) form, as
+                # expected by the checks below, until an object is placed
+                sampled_quats_xyzw = _quat_multiply_batch(
+                    region.quat_xyzw, sampled_quats[:, [1, 2, 3, 0]]
                 )
-            region_points += base_offset
-
-            for i in range(self.num_attempts):
-                # sample object coordinates
-                relative_x = self._sample_x()
-                relative_y = self._sample_y()
 
                 # apply rotation
-                object_x, object_y = rotate_2d_point(
-                    [relative_x, relative_y], rot=self.reference_rot
-                )
+                object_xy = relative_xy @ region.rot_mat
+                object_xy += (base_x, base_y)
+                # full positions of all attempts, so the checks below can take rows of
+                # it instead of building a new position for every attempt
+                object_pos = np.empty((num, 3))
+                object_pos[:, 0:2] = object_xy
+                object_pos[:, 2] = object_z
+
+                # cheaply reject attempts that are certain to fail, before the exact checks
+                valid = np.ones(num, dtype=bool)
+                if self.ensure_object_boundary_in_range:
+                    # a region with zero width along an axis doesn't constrain that
+                    # axis in obj_in_region, so only axes with some width are checked
+                    if x_hi > x_lo:
+                        valid &= (x_lo + margin <= relative_xy[:, 0]) & (
+                            relative_xy[:, 0] <= x_hi - margin
+                        )
+                    if y_hi > y_lo:
+                        valid &= (y_lo + margin <= relative_xy[:, 1]) & (
+                            relative_xy[:, 1] <= y_hi - margin
+                        )
+                if self.ensure_valid_placement:
+                    # the spawn reference object has to be intersected. (a failed attempt
+                    # can still end sampling early via the ref region check below, so
+                    # keep those attempts in that case)
+                    dx = object_xy[:, 0:1] - placed_pos[spawn_ref_ks, 0]
+                    dy = object_xy[:, 1:2] - placed_pos[spawn_ref_ks, 1]
+                    near_spawn_ref = (
+                        dx * dx + dy * dy <= (r_self + placed_r[spawn_ref_ks]) ** 2
+                    )
+                    if not (self.ensure_object_in_ref_region and reference is not None):
+                        valid &= near_spawn_ref.all(axis=1)
+
+                candidates = np.flatnonzero(valid)
+                if self.ensure_object_boundary_in_range:
+                    candidate_pos = object_pos[candidates]
+                    candidate_quats = sampled_quats_xyzw[candidates]
+
+                c = 0
+                while c < len(candidates):
+                    # ensure object placed fully in region. the compiled scan skips ahead
+                    # to the next candidate that passes, so only those reach the checks
+                    # below
+                    if self.ensure_object_boundary_in_range:
+                        c = first_obj_in_region(
+                            obj_offsets,
+                            candidate_pos,
+                            candidate_quats,
+                            p0=region_points[0],
+                            px=region_points[1],
+                            py=region_points[2],
+                            start=c,
+                            rotate=rotate,
+                        )
+                        if c < 0:
+                            break
+                    i = candidates[c]
+                    c += 1
 
-                object_x = object_x + base_offset[0]
-                object_y = object_y + base_offset[1]
-                object_z = self.z_offset + base_offset[2]
-                if on_top:
-                    object_z -= obj.bottom_offset[-1]
-
-                # random rotation
-                quat = self._sample_quat()
-                # multiply this quat by the object's initial rotation if it has the attribute specified
-                if hasattr(obj, "init_quat"):
-                    quat = quat_multiply(quat, obj.init_quat)
-                quat = convert_quat(
-                    quat_multiply(
-                        convert_quat(ref_quat, to="xyzw"),
-                        convert_quat(quat, to="xyzw"),
-                    ),
-                    to="wxyz",
-                )
+                    # position and random rotation
+                    pos = object_pos[i]
+                    quat = sampled_quats_xyzw[i]
 
-                location_valid = True
-
-                # ensure object placed fully in region
-                if self.ensure_object_boundary_in_range and not obj_in_region(
-                    obj,
-                    obj_pos=[object_x, object_y, object_z],
-                    obj_quat=convert_quat(quat, to="xyzw"),
-                    p0=region_points[0],
-                    px=region_points[1],
-                    py=region_points[2],
-                ):
-                    location_valid = False
-                    continue
+                    location_valid = True
 
-                # objects cannot overlap
-                if self.ensure_valid_placement:
-                    for (x, y, z), other_quat, other_obj in placed_objects.values():
-                        if spawn_ref_obj and other_obj == spawn_ref_obj:
-                            if not objs_intersect(
+                    # objects cannot overlap
+                    if self.ensure_valid_placement:
+                        for j, k in enumerate(spawn_ref_ks):
+                            if not near_spawn_ref[i, j] or not objs_intersect(
                                 obj=obj,
-                                obj_pos=[object_x, object_y, object_z],
-                                obj_quat=convert_quat(quat, to="xyzw"),
-                                other_obj=other_obj,
-                                other_obj_pos=[x, y, z],
-                                other_obj_quat=convert_quat(other_quat, to="xyzw"),
+                                obj_pos=pos,
+                                obj_quat=quat,
+                                other_obj=placed_objs[k],
+                                other_obj_pos=placed_pos[k],
+                                other_obj_quat=placed_xyzw[k],
                             ):
                                 location_valid = False
                                 break
-                        else:
-                            if objs_intersect(
+                        x, y = object_xy[i].tolist()
+                        for k in _grid_neighbors(grid, cell_size, x, y):
+                            if not location_valid:
+                                break
+                            dx, dy = x - placed_xy[k][0], y - placed_xy[k][1]
+                            if dx * dx + dy * dy > near_dist_sq[k]:
+                                continue
+                            location_valid = not objs_intersect(
                                 obj=obj,
-                                obj_pos=[object_x, object_y, object_z],
-                                obj_quat=convert_quat(quat, to="xyzw"),
-                                other_obj=other_obj,
-                                other_obj_pos=[x, y, z],
-                                other_obj_quat=convert_quat(other_quat, to="xyzw"),
+                                obj_pos=pos,
+                                obj_quat=quat,
+                                other_obj=placed_objs[k],
+                                other_obj_pos=placed_pos[k],
+                                other_obj_quat=placed_xyzw[k],
+                            )
+
+                    # ensure at least one point of the object should be in the region
+                    if self.ensure_object_in_ref_region and reference is not None:
+                        if not obj_in_region_with_keypoints(
+                            obj=obj,
+                            obj_pos=pos,
+                            obj_quat=quat,
+                            region_points=ref_region_points,
+                            min_num_points=3,
+                        ):
+                            location_valid = False
+                            stop = True
+                            break
+
+                    if (
+                        self.ensure_object_out_of_ref_region
+                        and neg_reference is not None
+                    ):
+                        for p0, px, py in neg_ref_region_points:
+                            if obj_in_region(
+                                obj=obj,
+                                obj_pos=pos,
+                                obj_quat=quat,
+                                p0=p0,
+                                px=px,
+                                py=py,
                             ):
                                 location_valid = False
                                 break
 
-                # ensure at least one point of the object should be in the region
-                if self.ensure_object_in_ref_region and reference is not None:
-                    _ref_pos, _ref_quat, _ref_obj = placed_objects[reference]
-                    if not obj_in_region_with_keypoints(
-                        obj=obj,
-                        obj_pos=[object_x, object_y, object_z],
-                        obj_quat=convert_quat(quat, to="xyzw"),
-                        region_points=_ref_obj.get_bbox_points(
-                            trans=_ref_pos, rot=_ref_quat
-                        )[:3],
-                        min_num_points=3,
-                    ):
-                        location_valid = False
+                    if location_valid:
+                        # location is valid, put the object down
+                        pos = (pos[0], pos[1], object_z)
+                        placed_objects[obj.name] = (pos, quat[[3, 0, 1, 2]], obj)
+                        if self.ensure_valid_placement:
+                            placed_objs.append(obj)
+                            placed_xyzw.append(quat)
+                            placed_pos[num_placed] = pos
+                            placed_r[num_placed] = r_self
+                            num_placed += 1
+                        success = True
+                        stop = True
                         break
 
-                if self.ensure_object_out_of_ref_region and neg_reference is not None:
-                    for nf in neg_reference:
-                        assert (
-                            nf in placed_objects
-                        ), "Invalid negative reference received. Current options are: {}, requested: {}".format(
-                            placed_objects.keys(), nf
-                        )
-                        _ref_pos, _ref_quat, _ref_obj = placed_objects[nf]
-                        if obj_in_region(
-                            obj=obj,
-                            obj_pos=[object_x, object_y, object_z],
-                            obj_quat=convert_quat(quat, to="xyzw"),
-                            p0=_ref_obj.get_bbox_points(trans=_ref_pos, rot=_ref_quat)[
-                                0
-                            ],
-                            px=_ref_obj.get_bbox_points(trans=_ref_pos, rot=_ref_quat)[
-                                1
-                            ],
-                            py=_ref_obj.get_bbox_points(trans=_ref_pos, rot=_ref_quat)[
-                                2
-                            ],
-                        ):
-                            location_valid = False
-                            break
-
-                if location_valid:
-                    # location is valid, put the object down
-                    pos = (object_x, object_y, object_z)
-                    placed_objects[obj.name] = (pos, quat, obj)
-                    success = True
+                if stop:
                     break
 
             if not success:
@@ -673,11 +990,11 @@ class SequentialCompositeSampler(ObjectPositionSampler):
             placed_objects.update(new_placements)
 
         # only return placements for newly placed objects
-        sampled_obj_names = [
+        sampled_obj_names = {
             obj.name
             for sampler in self.samplers.values()
             for obj in sampler.mujoco_objects
-        ]
+        }
         return {k: v for (k, v) in placed_objects.items() if k in sampled_obj_names}
 
 
@@ -705,6 +1022,15 @@ class MultiRegionSampler(ObjectPositionSampler):
                 "Invalid value for side, must be one of:", self.valid_sides
             )
 
+        super().__init__(
+            name=name,
+            mujoco_objects=mujoco_objects,
+            ensure_object_boundary_in_range=ensure_object_boundary_in_range,
+            ensure_valid_placement=ensure_valid_placement,
+            z_offset=z_offset,
+            rng=rng,
+        )
+
         # initialize sides and regions
         if side in self.sides_combinations:
             self.sides = self.sides_combinations[side]
@@ -712,27 +1038,49 @@ class MultiRegionSampler(ObjectPositionSampler):
             self.sides = [side]
         self.regions = regions
 
-        # create a list of uniform samplers (one for each site)
-        self.samplers = list()
-        for s in self.sides:
-            site = self.regions[s]
-            sampler = UniformRandomSampler(
-                name=name,
-                mujoco_objects=mujoco_objects,
-                reference_pos=site["pos"],
-                x_range=site["x_range"],
-                y_range=site["y_range"],
-                rotation=rotation,
-                rotation_axis=rotation_axis,
-                ensure_object_boundary_in_range=ensure_object_boundary_in_range,
-                ensure_valid_placement=ensure_valid_placement,
-                ensure_object_in_ref_region=ensure_object_in_ref_region,
-                z_offset=z_offset,
-                rng=rng,
+        # a single uniform sampler is shared by all sites. it shares this sampler's rng,
+        # and is given this sampler's objects and pointed at the chosen site before
+        # each sample
+        site = self.regions[self.sides[0]]
+        self.sampler = UniformRandomSampler(
+            name=name,
+            reference_pos=site["pos"],
+            x_range=site["x_range"],
+            y_range=site["y_range"],
+            rotation=rotation,
+            rotation_axis=rotation_axis,
+            ensure_object_boundary_in_range=ensure_object_boundary_in_range,
+            ensure_valid_placement=ensure_valid_placement,
+            ensure_object_in_ref_region=ensure_object_in_ref_region,
+            z_offset=z_offset,
+            rng=self.rng,
+        )
+
+        # (reference_pos, x_range, y_range, sampling region) of each site
+        self._site_params = tuple(
+            (
+                self.regions[s]["pos"],
+                self.regions[s]["x_range"],
+                self.regions[s]["y_range"],
+                self.sampler._compute_region(
+                    self.regions[s]["x_range"], self.regions[s]["y_range"]
+                ),
             )
-            self.samplers.append(sampler)
+            for s in self.sides
+        )
 
-    def sample(self, fixtures=None, reference=None, on_top=True):
-        # randomly picks a sampler and calls its sample function
-        sampler = self.rng.choice(self.samplers)
-        return sampler.sample(fixtures=fixtures, reference=reference, on_top=on_top)
+    def sample(self, placed_objects=None, reference=None, on_top=True):
+        # (reset() rebinds mujoco_objects, so it is passed on here rather than once)
+        self.sampler.mujoco_objects = self.mujoco_objects
+        # randomly picks a site and samples within it
+        pos, x_range, y_range, region = self._site_params[
+            self.rng.integers(len(self._site_params))
+        ]
+        self.sampler.reference_pos = pos
+        self.sampler.x_range = x_range
+        self.sampler.y_range = y_range
+        # (set after the ranges, which drop the sampler's region)
+        self.sampler._region = region
+        return self.sampler.sample(
+            placed_objects=placed_objects, reference=reference, on_top=on_top
+        )
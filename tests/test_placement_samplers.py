@@ -0,0 +1,21 @@
+import numpy as np
+from robosuite.models.objects import BoxObject
+
+from robocasa.utils.placement_samplers import UniformRandomSampler
+
+
+def test_sample_in_degenerate_region():
+    # regions with zero width along an axis (such as the default (0, 0) ranges) only
+    # constrain the other axis
+    for x_range, y_range in [((0, 0), (0, 0)), ((-0.3, 0.3), (0, 0))]:
+        sampler = UniformRandomSampler(
+            "sampler",
+            mujoco_objects=[BoxObject(name="box", size=[0.02] * 3)],
+            x_range=x_range,
+            y_range=y_range,
+            rotation=0,
+            rng=np.random.default_rng(0),
+        )
+        pos, _, _ = sampler.sample()["box"]
+        assert x_range[0] <= pos[0] <= x_range[1]
+        assert pos[1] == 0